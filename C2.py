@@ -3,6 +3,11 @@ import numpy as np
 import threading
 import time
 
+try:
+    from fastcrc import crc8 as fastcrc8  # optional native CRC backend
+except ImportError:
+    fastcrc8 = None
+
 # Simulation of virtual serial ports
 
 # Mac: First install socat using, brew install socat
@@ -20,6 +25,7 @@ import time
 # To install dependencies, 
 # pip install pyserial
 # pip install numpy
+# pip install fastcrc   (optional, computes the CRC-8 in native code)
 
 # Now to run your code, 
 # python3 send_and_receive.py
@@ -40,22 +46,39 @@ MAX_PWM = 255
 MIN_PWM = 0
 MAX_PWM_CHANGE = 50    # Maximum allowed change between consecutive values
 
+# Reusable packet buffer for send_data: START + LENGTH + up to 255 PWM values + CRC + END
+# Only the sender thread calls send_data, so one buffer is enough
+SEND_BUFFER = bytearray(255 + 4)
+
 # ==================== CRC CALCULATION ====================
+def _crc8_byte(crc):
+    """
+    Run one byte through the CRC-8 shift register bit by bit
+    Used only to build CRC8_TABLE at import time
+    """
+    for _ in range(8):
+        mask = (0 - ((crc >> 7) & 1)) & 0x07 #0x07 if the MSB is 1, else 0 (no branch)
+        crc = ((crc << 1) ^ mask) & 0xFF #shift, apply polynomial and chop to 8 bits in one step
+    return crc
+
+# Lookup table: CRC8_TABLE[i] is the register after clocking in byte i
+# Stored as bytes so indexing returns a small int without allocating
+CRC8_TABLE = bytes(_crc8_byte(i) for i in range(256))
+
 def calculate_crc(data):
     """
     Calculate CRC-8 checksum for error detection
     Uses polynomial 0x07 (x^8 + x^2 + x + 1)
     """
     #used 0x07 because it is the smallest one among most commonly used polynomials 
+    if fastcrc8 is not None:
+        #CRC-8/SMBUS is this exact variant: poly 0x07, init 0x00, no reflection, no final xor
+        return fastcrc8.smbus(bytes(data))
+
+    table = CRC8_TABLE
     crc = 0
     for byte in data:
-        crc ^= byte #done to accumulate the next element of a data packets data
-        for _ in range(8):
-            if crc & 0x80: #checks if the MSB is 1
-                crc = (crc << 1) ^ 0x07
-            else:
-                crc <<= 1
-            crc &= 0xFF #chops the MSB off to 8 bits
+        crc = table[crc ^ byte] #accumulate the next byte and run all 8 shifts in one lookup
     return crc
 
 # ==================== SENDER FUNCTION ====================
@@ -73,43 +96,34 @@ def send_data(ser: serial.Serial, data: np.ndarray) -> None:
     - END_BYTE (0x55): Marks end of packet
     """
     
-    data_to_send = []
-    
-    # Step 1: Add START byte
-    data_to_send.append(START_BYTE)
-    
-    # Step 2: Add data length
+    # Step 1: Reuse the packet buffer instead of allocating one per packet
     data_length = len(data)
-    data_to_send.append(data_length)
+    data_to_send = memoryview(SEND_BUFFER)[:data_length + 4]
+    
+    # Step 2: Add START byte and data length
+    data_to_send[0] = START_BYTE
+    data_to_send[1] = data_length
     
     # Step 3: Add PWM values with range validation
-    pwm_values = []
-    for pwm in data:
-        # Convert to integer and validate range
-        pwm_value = int(pwm)
-        if pwm_value < MIN_PWM:
-            pwm_value = MIN_PWM
-        elif pwm_value > MAX_PWM:
-            pwm_value = MAX_PWM
-        pwm_values.append(pwm_value)
-        data_to_send.append(pwm_value)
+    # Clamp the whole array at once, then convert to one byte per value
+    pwm_values = np.clip(data, MIN_PWM, MAX_PWM).astype(np.uint8)
+    data_to_send[2:data_length + 2] = pwm_values.data
     
     # Step 4: Calculate CRC over length + PWM data
-    crc_data = bytes([data_length] + pwm_values)
-    crc = calculate_crc(crc_data)
-    data_to_send.append(crc)
+    crc = calculate_crc(data_to_send[1:data_length + 2])
+    data_to_send[data_length + 2] = crc
     
     # Step 5: Add END byte
-    data_to_send.append(END_BYTE)
+    data_to_send[data_length + 3] = END_BYTE
     
     # For challenge question - simulate random bit corruption
     '''for i in range(len(data_to_send)):
         if np.random.random() < BYTE_RESET_PROBABLITY:
             data_to_send[i] = 0x00'''
     
-    # Step 6: Send data one byte at a time (as required)
-    for byte in data_to_send:
-        ser.write(bytes([byte]))
+    # Step 6: Send the whole packet in one write
+    # The bytes still go out on the wire one after another in the same order
+    ser.write(data_to_send)
 
 # ==================== RECEIVER FUNCTION ====================
 def receive_data(ser: serial.Serial) -> tuple[np.ndarray, bool]:
@@ -121,7 +135,7 @@ def receive_data(ser: serial.Serial) -> tuple[np.ndarray, bool]:
         - acknowledgement: True if valid, False if corrupted
     """
     
-    received_pwm_data = []
+    received_pwm_data = b''
     acknowledgement = False
     
     try:
@@ -143,35 +157,26 @@ def receive_data(ser: serial.Serial) -> tuple[np.ndarray, bool]:
         if data_length == 0 or data_length > 200:
             return np.array([]), False
         
-        # Step 3: Read PWM values
-        pwm_values = []
-        for _ in range(data_length):
-            pwm_byte = ser.read(1)
-            if len(pwm_byte) == 0:
-                return np.array([]), False
-            pwm_values.append(pwm_byte[0])
-        
-        # Step 4: Read CRC
-        crc_byte = ser.read(1)
-        if len(crc_byte) == 0:
+        # Step 3: Read PWM values, CRC and END byte in one call
+        rest = ser.read(data_length + 2)
+        if len(rest) != data_length + 2:
             return np.array([]), False
-        received_crc = crc_byte[0]
+        pwm_values = rest[:data_length]
+        received_crc = rest[data_length]
         
-        # Step 5: Read END byte
-        end_byte = ser.read(1)
-        if len(end_byte) == 0 or end_byte[0] != END_BYTE:
+        # Step 4: Check END byte
+        if rest[data_length + 1] != END_BYTE:
             return np.array([]), False
         
-        # Step 6: Validate CRC
-        crc_data = bytes([data_length] + pwm_values)
-        calculated_crc = calculate_crc(crc_data)
+        # Step 5: Validate CRC
+        calculated_crc = calculate_crc(length_byte + pwm_values)
         
         if calculated_crc != received_crc:
             # CRC mismatch - data corrupted
             print("CRC Error")
-            return np.array(pwm_values), False  # Return data but mark as failed
+            return np.frombuffer(pwm_values, dtype=np.uint8), False  # Return data but mark as failed
         
-        # Step 7: Range validation on all PWM values
+        # Step 6: Range validation on all PWM values
         valid = True
         for pwm in pwm_values:
             if pwm < MIN_PWM or pwm > MAX_PWM:
@@ -180,9 +185,9 @@ def receive_data(ser: serial.Serial) -> tuple[np.ndarray, bool]:
                 break
         
         if not valid:
-            return np.array(pwm_values), False
+            return np.frombuffer(pwm_values, dtype=np.uint8), False
         
-        # Step 8: All checks passed!
+        # Step 7: All checks passed!
         received_pwm_data = pwm_values
         acknowledgement = True
         print("CRC Valid")
@@ -191,13 +196,14 @@ def receive_data(ser: serial.Serial) -> tuple[np.ndarray, bool]:
         print(f"    ⚠️  Receive Error: {e}")
         return np.array([]), False
     
-    return np.array(received_pwm_data), acknowledgement
+    return np.frombuffer(received_pwm_data, dtype=np.uint8), acknowledgement
 
 # ==================== THREADING FUNCTIONS ====================
 def receive_thread_task(received_data: list, no_of_success: int):
     no_of_tries = 0
     try:
-        with serial.Serial(port_receiver, 9600, timeout=0.2) as ser:
+        # Reads block until data arrives (up to 1 s), so no polling sleep is needed
+        with serial.Serial(port_receiver, 9600, timeout=1.0) as ser:
             while len(received_data) < 100 and no_of_tries < 150:
                 print(f"[RECEIVER] [{no_of_tries}] Trying to Receive Data")
 
@@ -211,7 +217,6 @@ def receive_thread_task(received_data: list, no_of_success: int):
                     else: 
                         print(f"[RECEIVER] [{len(received_data)}] FAILED")
                 no_of_tries += 1
-                time.sleep(0.01) 
             else: 
                 print(f"[RECEIVER] Time Out")
     except Exception as e:
@@ -227,8 +232,10 @@ def send_thread_task(all_data):
     except Exception as e:
         print(f"Sender Thread Error: {e}")
 
-def generate_pwm():
-    pwm = np.random.randint(0, 255, size=(100,))
+def generate_pwm(no_of_packets=100, packet_size=100):
+    # One call generates every packet; each row is one packet's PWM values
+    rng = np.random.default_rng()
+    pwm = rng.integers(0, 256, size=(no_of_packets, packet_size), dtype=np.uint8)
     return pwm
 
 # ==================== MAIN FUNCTION ====================
@@ -242,7 +249,7 @@ def main():
     print("=" * 60)
     print()
 
-    pwm_data = [generate_pwm() for i in range(100)]
+    pwm_data = generate_pwm()
     received_data = []
     no_of_success = [0]
 
@@ -1,160 +1,325 @@
 import csv
+import functools
+import itertools
+import multiprocessing
+import operator
+import os
 import sys
 
 # CRC Polynomial for CAN: 0x4599
 CRC_POLYNOMIAL = 0x4599
 CRC_WIDTH = 15  # CRC-15
+CRC_MASK = (1 << CRC_WIDTH) - 1
+
+# CSV columns in the order parse_can_frame expects them
+CSV_COLUMNS = ('timestamp', 'id', 'ide', 'rtr', 'dlc', 'data', 'crc', 'errors')
+
+# Frames per chunk handed to a worker process
+CHUNK_SIZE = 10000
+
+# Bits in the CRC-covered header: ID (11) + RTR (1) + IDE (1) + r0 (1) + DLC (4)
+HEADER_BITS = 18
+@functools.lru_cache(maxsize=4096)
+def parse_header_fields(id_str, ide_str, rtr_str, dlc_str):
+    """
+    Convert the numeric header columns of a CAN frame to integers
+
+    Logs repeat the same ID/IDE/RTR/DLC combinations, so results are cached
+    on the raw strings and most rows skip the int() calls entirely
+
+    Args:
+        id_str: Hex frame ID
+        ide_str: IDE flag
+        rtr_str: RTR flag
+        dlc_str: Data length code
+
+    Returns:
+        Tuple of (frame_id, ide, rtr, dlc) as integers
+    """
+    return int(id_str, 16), int(ide_str), int(rtr_str), int(dlc_str)
 def parse_can_frame(row):
     """
     Parse a CAN frame from CSV row
 
     Args:
-        row: Dictionary containing timestamp, id, ide, rtr, dlc, data, crc, errors
+        row: Sequence of timestamp, id, ide, rtr, dlc, data, crc, errors (in CSV_COLUMNS order)
 
     Returns:
         Dictionary with parsed frame data
     """
+    timestamp, id_str, ide_str, rtr_str, dlc_str, data_str, crc_str, errors = row
     result = {}
 
-    result['timestamp'] = row['timestamp']
+    result['timestamp'] = timestamp
+
+    # Parse numeric header fields
+    frame_id, ide, rtr, dlc = parse_header_fields(id_str, ide_str, rtr_str, dlc_str)
 
     # Parse ID
-    frame_id = int(row['id'], 16)
     result['id_value'] = frame_id
 
     # Check if ID is valid (11-bit max = 0x7FF = 2047)
-    if frame_id > 0x7FF:
-        result['id_valid'] = False
-        result['id_bits'] = None
-    else:
-        result['id_valid'] = True
-        result['id_bits'] = [(frame_id >> (10 - i)) & 1 for i in range(11)]
+    result['id_valid'] = (frame_id <= 0x7FF)
 
     # Parse IDE and RTR
-    result['ide'] = int(row['ide'])
-    result['rtr_bits'] = [int(row['rtr'])]
+    result['ide'] = ide
+    result['rtr'] = rtr
 
     # Parse DLC
-    dlc = int(row['dlc'])
+    result['dlc'] = dlc
     result['dlc_valid'] = (0 <= dlc <= 8)
-    result['dlc_bits'] = [(dlc >> (3 - i)) & 1 for i in range(4)]
+
+    # Pack the header fields covered by the CRC into one integer
+    # Order: ID (11 bits) + RTR (1 bit) + IDE (1 bit) + 0 (1 bit, reserved=0) + DLC (4 bits)
+    result['header'] = ((frame_id & 0x7FF) << 7) | ((rtr & 1) << 6) | ((ide & 1) << 5) | (dlc & 0x0F)
 
     # Parse Data bytes
-    data_str = row['data'].strip()
+    data_str = data_str.strip()
     if data_str:
-        data_bytes = [int(x, 16) for x in data_str.split()]
-        result['data_bits'] = []
-        for byte in data_bytes:
-            for i in range(8):
-                result['data_bits'].append((byte >> (7 - i)) & 1)
+        tokens = data_str.split()
+        data_bytes = None
+        if all(len(token) == 2 for token in tokens):
+            try:
+                # Space separated hex pairs decode in a single C-level call
+                data_bytes = bytes.fromhex(data_str)
+            except ValueError:
+                pass
+        if data_bytes is None:
+            # Fall back for entries that are not two-digit hex pairs, so each
+            # token still counts as one byte (e.g. "0A0B" stays a single value)
+            data_bytes = [int(x, 16) for x in tokens]
+        result['data_bytes'] = data_bytes
 
         # Check if data length matches DLC
         result['data_length_match'] = (len(data_bytes) == dlc)
     else:
-        result['data_bits'] = []
+        result['data_bytes'] = b''
         result['data_length_match'] = (dlc == 0)
 
     # Parse expected CRC
-    result['expected_crc'] = int(row['crc'], 16)
+    result['expected_crc'] = int(crc_str, 16)
 
     # Parse errors
-    result['errors'] = row['errors']
+    result['errors'] = errors
 
     return result
-def calculate_crc(data_bits):
+def _crc15_byte(index):
     """
-    Calculate CRC-15 using polynomial 0x4599 via modulo-2 division
+    Compute the CRC-15 table entry for one byte shifted into a zero register
 
     Args:
-        data_bits: List of bits (0 or 1) representing the data
+        index: Byte value (0-255)
 
     Returns:
-        15-bit CRC value as integer
+        15-bit CRC register after clocking in the 8 bits of index
     """
-    # Append 15 zeros for CRC calculation
-    extended_bits = data_bits.copy() + [0] * CRC_WIDTH
-
-    # Convert polynomial to binary representation
-    # 0x4599 = 0b100010110011001 (15 bits)
-    poly_value = CRC_POLYNOMIAL
-    poly_bits = []
-    for i in range(CRC_WIDTH + 1):
-        poly_bits.append((poly_value >> (CRC_WIDTH - i)) & 1)
-
-    # Perform modulo-2 division (XOR-based)
-    for i in range(len(data_bits)):
-        if extended_bits[i] == 1:
-            # XOR with polynomial
-            for j in range(len(poly_bits)):
-                extended_bits[i + j] ^= poly_bits[j]
-
-    # Extract the remainder (last 15 bits)
-    crc_value = 0
-    for i in range(CRC_WIDTH):
-        crc_value = (crc_value << 1) | extended_bits[len(data_bits) + i]
-
-    return crc_value
-def validate_can_frames(csv_file):
+    crc = index << (CRC_WIDTH - 8)
+    for _ in range(8):
+        if crc & (1 << (CRC_WIDTH - 1)):
+            crc = (crc << 1) ^ CRC_POLYNOMIAL
+        else:
+            crc <<= 1
+        crc &= CRC_MASK
+    return crc
+
+
+# Byte-wise lookup table: processes 8 bits of the stream per step
+CRC15_TABLE = [_crc15_byte(i) for i in range(256)]
+@functools.lru_cache(maxsize=8192)
+def header_crc_state(header, header_bits):
     """
-    Validate CAN frames from CSV file
+    Compute the CRC-15 register after clocking in a frame header
+
+    The result depends only on the ID/RTR/IDE/DLC fields, so it is cached
+    and frames with a repeated header only need their data bytes folded in
 
     Args:
-        csv_file: Path to CSV file containing CAN frames
+        header: Frame header fields packed into an integer (MSB first)
+        header_bits: Number of bits in header
+
+    Returns:
+        15-bit CRC register value
     """
-    print("=" * 90)
-    print("CAN DATA FRAME CRC VALIDATOR")
-    print(f"CRC Polynomial: 0x{CRC_POLYNOMIAL:04X} ")
-    print("=" * 90)
-    print()
+    # Leading header bits that do not fill a whole byte: clocking k <= 8 bits
+    # into a zero register gives the same remainder as the table entry for
+    # their value, so a single lookup replaces the bit-by-bit shifts
+    header_bytes = header_bits // 8
+    crc = CRC15_TABLE[header >> (header_bytes * 8)]
+
+    # Remaining header bits are byte aligned: process them through the table
+    remaining = header & ((1 << (header_bytes * 8)) - 1)
+    for byte in remaining.to_bytes(header_bytes, 'big'):
+        crc = ((crc << 8) ^ CRC15_TABLE[((crc >> (CRC_WIDTH - 8)) ^ byte) & 0xFF]) & CRC_MASK
+    return crc
+def calculate_crc(header, header_bits, data_bytes):
+    """
+    Calculate CRC-15 using polynomial 0x4599, one byte at a time via CRC15_TABLE
 
-    try:
-        with open(csv_file, 'r') as f:
-            reader = csv.DictReader(f)
+    Args:
+        header: Frame header fields packed into an integer (MSB first)
+        header_bits: Number of bits in header
+        data_bytes: Sequence of data byte values following the header
 
-            for row in reader:
-                # Parse the frame
-                frame = parse_can_frame(row)
+    Returns:
+        15-bit CRC value as integer
+    """
+    crc = header_crc_state(header, header_bits)
+
+    # Fold in the data bytes through the table
+    # (table and shift bound to locals to keep the hot loop on fast lookups)
+    table = CRC15_TABLE
+    shift = CRC_WIDTH - 8
+    mask = CRC_MASK
+    for byte in data_bytes:
+        crc = ((crc << 8) ^ table[((crc >> shift) ^ byte) & 0xFF]) & mask
+
+    return crc
+def check_frame(frame):
+    """
+    Determine the error type of a parsed CAN frame
 
-                # Display frame information
-                print(f"{frame['timestamp']}:", end = '')
+    Args:
+        frame: Dictionary returned by parse_can_frame
+
+    Returns:
+        Error type string ("none" if the frame is valid)
+    """
+    # Calculate CRC if frame is structurally valid
+    can_calculate = frame['id_valid'] and frame['dlc_valid']
+
+    if can_calculate:
+        # Calculate CRC over the packed header followed by the data bytes (exclude timestamp)
+        calculated_crc = calculate_crc(frame['header'], HEADER_BITS, frame['data_bytes'])
+
+        # Validate
+        crc_match = (calculated_crc == frame['expected_crc'])
+
+        # Determine error type
+        if not frame['data_length_match']:
+            return "mismatch_of_dlc_and_data_frame"
+        elif not crc_match:
+            return "bad_crc"
+        return "none"
+    elif not frame['id_valid']:
+        return "bad_id"
+    return "bad_dlc"
+def validate_chunk(rows):
+    """
+    Parse and check a chunk of CAN frames (runs in a worker process)
 
+    Args:
+        rows: List of CSV rows in CSV_COLUMNS order (may end with a read error)
 
-                
+    Returns:
+        Tuple of (results, error): (timestamp, error_type, given_errors) tuples
+        in input order for the frames before the first failure, and the
+        exception that stopped the chunk (None if every frame was checked)
+    """
+    results = []
+    for row in rows:
+        if isinstance(row, Exception):
+            return results, row
+        try:
+            frame = parse_can_frame(row)
+            results.append((frame['timestamp'], check_frame(frame), frame['errors']))
+        except Exception as e:
+            return results, e
+    return results, None
+def complete_rows(reader, width):
+    """
+    Skip blank lines and pad short rows, as csv.DictReader does
 
-                # Calculate CRC if frame is structurally valid
-                can_calculate = frame['id_valid'] and frame['dlc_valid']
+    Args:
+        reader: csv.reader positioned after the header
+        width: Number of header columns
 
-                if can_calculate:
-                    # Combine all bits for CRC calculation (exclude timestamp)
-                    # Order: ID (11 bits) + RTR (1 bit) + IDE (1 bit) + 0 (1 bit, reserved=0) + DLC (4 bits) + Data
-                    all_bits = frame['id_bits'] + frame['rtr_bits'] + [frame['ide']] + [0] + frame['dlc_bits'] + frame['data_bits']
+    Yields:
+        Rows with at least width fields (missing fields are None)
+    """
+    for row in reader:
+        if not row:
+            continue
+        if len(row) < width:
+            row = row + [None] * (width - len(row))
+        yield row
+def chunk_rows(rows, size):
+    """
+    Group rows into lists of at most size rows
 
-                    # Calculate CRC
-                    calculated_crc = calculate_crc(all_bits)
+    Args:
+        rows: Iterable of CSV rows
+        size: Maximum number of rows per chunk
 
-                    # Validate
-                    crc_match = (calculated_crc == frame['expected_crc'])
+    Yields:
+        Lists of rows; if reading fails, the last list ends with the exception
+    """
+    chunk = []
+    try:
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+    except Exception as e:
+        # Keep the rows read so far; the error is reported after their results
+        chunk.append(e)
+    if chunk:
+        yield chunk
+def print_results(chunk_results):
+    """
+    Print the check result of every frame
 
-                    # Determine error type
-                    
-                    if not frame['data_length_match']:
-                        error_type = "mismatch_of_dlc_and_data_frame"
-                    elif not crc_match:
-                        error_type = "bad_crc"
-                    else:
-                        error_type = "none"
-                else:    
-                    if not frame['id_valid']:
-                        error_type = "bad_id"
-                    elif not frame['dlc_valid']:
-                        error_type = "bad_dlc"
-                # Print result (single clean print)
-                print(f"THE CAN FRAME CHECK IS SUCCESS. (error: {error_type}). The given error is {frame['errors']}")
-                    
+    Args:
+        chunk_results: Iterable of (results, error) tuples returned by validate_chunk
 
+    Raises:
+        The first error reported by a chunk, after the results before it are printed
+    """
+    write = sys.stdout.write
+    for results, error in chunk_results:
+        # Join the whole chunk and write it at once instead of one print per frame
+        write(''.join([
+            f"{timestamp}:THE CAN FRAME CHECK IS SUCCESS. (error: {error_type}). The given error is {given_errors}\n"
+            for timestamp, error_type, given_errors in results
+        ]))
+        if error is not None:
+            raise error
+def validate_can_frames(csv_file):
+    """
+    Validate CAN frames from CSV file
 
-            
+    Args:
+        csv_file: Path to CSV file containing CAN frames
+    """
+    print("=" * 90)
+    print("CAN DATA FRAME CRC VALIDATOR")
+    print(f"CRC Polynomial: 0x{CRC_POLYNOMIAL:04X} ")
+    print("=" * 90)
+    print()
 
+    try:
+        with open(csv_file, 'r') as f:
+            reader = csv.reader(f)
+
+            # Resolve column positions once instead of building a dict per row
+            header = next(reader, None)
+            if header is None:
+                # Empty file: no frames to check
+                return
+            pick_columns = operator.itemgetter(*(header.index(name) for name in CSV_COLUMNS))
+
+            rows = complete_rows(reader, len(header))
+            chunks = chunk_rows(map(pick_columns, rows), CHUNK_SIZE)
+            first_chunk = next(chunks, [])
+
+            if len(first_chunk) < CHUNK_SIZE or (os.cpu_count() or 1) < 2:
+                # Small log or a single CPU: not worth starting worker processes
+                print_results(map(validate_chunk, itertools.chain([first_chunk], chunks)))
+            else:
+                # Frames are independent, so chunks are checked in parallel;
+                # imap keeps the chunks in file order for printing
+                with multiprocessing.Pool() as pool:
+                    print_results(pool.imap(validate_chunk, itertools.chain([first_chunk], chunks)))
 
     except FileNotFoundError:
         print(f"Error: File '{csv_file}' not found!")